@@ -14,7 +14,7 @@ ConstraintSymbolType = Literal["=", ">=", "<="]
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintResult:
     """The constraint quantities given the current state of the code
     (aka given an evaluation at the point x).
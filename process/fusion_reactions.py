@@ -1,7 +1,9 @@
 import logging
+import math
 from dataclasses import dataclass
 
 import numpy as np
+from numba import njit
 from scipy import integrate
 
 from process import constants
@@ -178,14 +180,36 @@ class FusionReactionRate:
         """
         # Divide by 2 to get the branching ratio for the D-D reaction that produces tritium as the output
         # is just the ratio of the two normalized cross sections
+        # Quartic fit evaluated in Horner form
         self.f_dd_branching_trit = (
             1.02934
-            - 8.3264e-3 * ion_temperature
-            + 1.7631e-4 * ion_temperature**2
-            - 1.8201e-6 * ion_temperature**3
-            + 6.9855e-9 * ion_temperature**4
+            + ion_temperature
+            * (
+                -8.3264e-3
+                + ion_temperature
+                * (
+                    1.7631e-4
+                    + ion_temperature * (-1.8201e-6 + 6.9855e-9 * ion_temperature)
+                )
+            )
         ) / 2.0
 
+    def _ion_temperature_profile(self) -> np.ndarray:
+        """
+        Ion temperature profile in keV.
+
+        Since the electron temperature profile is only calculated directly, the ion
+        temperature profile is the electron profile scaled by the ratio of the volume
+        averaged ion to electron temperature.
+
+        Returns:
+            np.ndarray: Ion temperature at each point in the profile (keV).
+        """
+        return (
+            physics_variables.temp_plasma_ion_vol_avg_kev
+            / physics_variables.temp_plasma_electron_vol_avg_kev
+        ) * self.plasma_profile.teprofile.profile_y
+
     def dt_reaction(self) -> None:
         """D + T --> 4He + n reaction
 
@@ -207,18 +231,14 @@ class FusionReactionRate:
         Returns:
             None
         """
-        # Initialize Bosch-Hale constants for the D-T reaction
-        dt = BoschHaleConstants(**REACTION_CONSTANTS_DT)
+        # Evaluate the reactivity over the profile once; it is shared by the
+        # reaction rate profile and the fusion rate integral
+        sigv = bosch_hale_reactivity(
+            self._ion_temperature_profile(), BOSCH_HALE_CONSTANTS_DT
+        )
 
         physics_variables.fusrat_plasma_dt_profile = (
-            bosch_hale_reactivity(
-                (
-                    physics_variables.temp_plasma_ion_vol_avg_kev
-                    / physics_variables.temp_plasma_electron_vol_avg_kev
-                )
-                * self.plasma_profile.teprofile.profile_y,
-                dt,
-            )
+            sigv
             * physics_variables.f_plasma_fuel_deuterium
             * physics_variables.f_plasma_fuel_tritium
             * (
@@ -233,7 +253,7 @@ class FusionReactionRate:
 
         # Calculate the fusion reaction rate integral using Simpson's rule
         sigmav = integrate.simpson(
-            fusion_rate_integral(self.plasma_profile, dt),
+            fusion_rate_integral(self.plasma_profile, sigv),
             x=self.plasma_profile.neprofile.profile_x,
             dx=self.plasma_profile.neprofile.profile_dx,
         )
@@ -306,25 +326,21 @@ class FusionReactionRate:
         Returns:
             None
         """
-        # Initialize Bosch-Hale constants for the D-3He reaction
-        dhe3 = BoschHaleConstants(**REACTION_CONSTANTS_DHE3)
+        # Evaluate the reactivity over the profile once; it is shared by the
+        # reaction rate profile and the fusion rate integral
+        sigv = bosch_hale_reactivity(
+            self._ion_temperature_profile(), BOSCH_HALE_CONSTANTS_DHE3
+        )
 
         # Calculate the fusion reaction rate integral using Simpson's rule
         sigmav = integrate.simpson(
-            fusion_rate_integral(self.plasma_profile, dhe3),
+            fusion_rate_integral(self.plasma_profile, sigv),
             x=self.plasma_profile.neprofile.profile_x,
             dx=self.plasma_profile.neprofile.profile_dx,
         )
 
         physics_variables.fusrat_plasma_dhe3_profile = (
-            bosch_hale_reactivity(
-                (
-                    physics_variables.temp_plasma_ion_vol_avg_kev
-                    / physics_variables.temp_plasma_electron_vol_avg_kev
-                )
-                * self.plasma_profile.teprofile.profile_y,
-                dhe3,
-            )
+            sigv
             * physics_variables.f_plasma_fuel_deuterium
             * physics_variables.f_plasma_fuel_helium3
             * (
@@ -403,25 +419,21 @@ class FusionReactionRate:
         Returns:
             None
         """
-        # Initialize Bosch-Hale constants for the D-D reaction
-        dd1 = BoschHaleConstants(**REACTION_CONSTANTS_DD1)
+        # Evaluate the reactivity over the profile once; it is shared by the
+        # reaction rate profile and the fusion rate integral
+        sigv = bosch_hale_reactivity(
+            self._ion_temperature_profile(), BOSCH_HALE_CONSTANTS_DD1
+        )
 
         # Calculate the fusion reaction rate integral using Simpson's rule
         sigmav = integrate.simpson(
-            fusion_rate_integral(self.plasma_profile, dd1),
+            fusion_rate_integral(self.plasma_profile, sigv),
             x=self.plasma_profile.neprofile.profile_x,
             dx=self.plasma_profile.neprofile.profile_dx,
         )
 
         physics_variables.fusrat_plasma_dd_helion_profile = (
-            bosch_hale_reactivity(
-                (
-                    physics_variables.temp_plasma_ion_vol_avg_kev
-                    / physics_variables.temp_plasma_electron_vol_avg_kev
-                )
-                * self.plasma_profile.teprofile.profile_y,
-                dd1,
-            )
+            sigv
             * physics_variables.f_plasma_fuel_deuterium
             * physics_variables.f_plasma_fuel_deuterium
             * (
@@ -503,25 +515,21 @@ class FusionReactionRate:
         Returns:
             None
         """
-        # Initialize Bosch-Hale constants for the D-D reaction
-        dd2 = BoschHaleConstants(**REACTION_CONSTANTS_DD2)
+        # Evaluate the reactivity over the profile once; it is shared by the
+        # reaction rate profile and the fusion rate integral
+        sigv = bosch_hale_reactivity(
+            self._ion_temperature_profile(), BOSCH_HALE_CONSTANTS_DD2
+        )
 
         # Calculate the fusion reaction rate integral using Simpson's rule
         sigmav = integrate.simpson(
-            fusion_rate_integral(self.plasma_profile, dd2),
+            fusion_rate_integral(self.plasma_profile, sigv),
             x=self.plasma_profile.neprofile.profile_x,
             dx=self.plasma_profile.neprofile.profile_dx,
         )
 
         physics_variables.fusrat_plasma_dd_triton_profile = (
-            bosch_hale_reactivity(
-                (
-                    physics_variables.temp_plasma_ion_vol_avg_kev
-                    / physics_variables.temp_plasma_electron_vol_avg_kev
-                )
-                * self.plasma_profile.teprofile.profile_y,
-                dd2,
-            )
+            sigv
             * physics_variables.f_plasma_fuel_deuterium
             * physics_variables.f_plasma_fuel_deuterium
             * (
@@ -654,7 +662,7 @@ class FusionReactionRate:
         physics_variables.f_dd_branching_trit = self.f_dd_branching_trit
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoschHaleConstants:
     """DataClass which holds the constants required for the Bosch Hale calculation
     for a given fusion reaction.
@@ -671,15 +679,21 @@ class BoschHaleConstants:
     cc7: float
 
 
-def fusion_rate_integral(
-    plasma_profile: PlasmaProfile, reaction_constants: BoschHaleConstants
-) -> np.ndarray:
+# Bosch-Hale constants for each reaction, built once at import
+BOSCH_HALE_CONSTANTS_DT = BoschHaleConstants(**REACTION_CONSTANTS_DT)
+BOSCH_HALE_CONSTANTS_DHE3 = BoschHaleConstants(**REACTION_CONSTANTS_DHE3)
+BOSCH_HALE_CONSTANTS_DD1 = BoschHaleConstants(**REACTION_CONSTANTS_DD1)
+BOSCH_HALE_CONSTANTS_DD2 = BoschHaleConstants(**REACTION_CONSTANTS_DD2)
+
+
+def fusion_rate_integral(plasma_profile: PlasmaProfile, sigv: np.ndarray) -> np.ndarray:
     """
     Evaluate the integrand for the fusion power integration.
 
     Parameters:
         plasma_profile (PlasmaProfile): Parameterised temperature and density profiles.
-        reactionconstants (BoschHaleConstants): Bosch-Hale reaction constants.
+        sigv (np.ndarray): Bosch-Hale reactivity 〈sigmav〉 (m^3/s) at each point in the
+            ion temperature profile.
 
     Returns:
         np.ndarray: Integrand for the fusion power.
@@ -690,16 +704,6 @@ def fusion_rate_integral(
           doi: https://doi.org/10.1088/0029-5515/32/4/i07.
     """
 
-    # Since the electron temperature profile is only calculated directly, we scale the ion temperature
-    # profile by the ratio of the volume averaged ion to electron temperature
-    ion_temperature_profile = (
-        physics_variables.temp_plasma_ion_vol_avg_kev
-        / physics_variables.temp_plasma_electron_vol_avg_kev
-    ) * plasma_profile.teprofile.profile_y
-
-    # Number of fusion reactions per unit volume per particle volume density (m^3/s)
-    sigv = bosch_hale_reactivity(ion_temperature_profile, reaction_constants)
-
     # Integrand for the volume averaged fusion reaction rate sigmav:
     # sigmav = integral(2 rho (sigv(rho) ni(rho)^2) drho),
     # divided by the square of the volume-averaged ion density
@@ -718,8 +722,8 @@ def fusion_rate_integral(
 
 
 def bosch_hale_reactivity(
-    ion_temperature_profile: np.ndarray, reaction_constants: BoschHaleConstants
-) -> np.ndarray:
+    ion_temperature_profile: np.ndarray | float, reaction_constants: BoschHaleConstants
+) -> np.ndarray | float:
     """
     Calculate the volumetric fusion reaction rate 〈sigmav〉 (m^3/s) for one of four nuclear reactions using
     the Bosch-Hale parametrization.
@@ -733,17 +737,22 @@ def bosch_hale_reactivity(
         4. D-D 2nd reaction
 
     Parameters:
-        ion_temperature_profile (np.ndarray): Plasma ion temperature profile in keV.
+        ion_temperature_profile (np.ndarray | float): Plasma ion temperature profile
+            (or a single temperature) in keV.
         reaction_constants (BoschHaleConstants): Bosch-Hale reaction constants.
 
     Returns:
-        np.ndarray: Volumetric fusion reaction rate 〈sigmav〉 in m^3/s for each point in the ion temperature profile.
+        np.ndarray | float: Volumetric fusion reaction rate 〈sigmav〉 in m^3/s for each point in the ion temperature profile,
+            or a float for a single temperature.
 
     References:
         - H.-S. Bosch and G. M. Hale, “Improved formulas for fusion cross-sections and thermal reactivities,”
           Nuclear Fusion, vol. 32, no. 4, pp. 611-631, Apr. 1992,
           doi: https://doi.org/10.1088/0029-5515/32/4/i07.
     """
+    # Work on an array so a scalar T = 0 takes the same masked path as a profile
+    ion_temperature_profile = np.asarray(ion_temperature_profile, dtype=float)
+
     theta1 = (
         ion_temperature_profile
         * (
@@ -766,7 +775,7 @@ def bosch_hale_reactivity(
     )
     theta = ion_temperature_profile / (1.0 - theta1)
 
-    xi = ((reaction_constants.bg**2) / (4.0 * theta)) ** (1 / 3)
+    xi = ((reaction_constants.bg * reaction_constants.bg) / (4.0 * theta)) ** (1 / 3)
 
     # Volumetric reaction rate / reactivity 〈sigmav〉 (m^3/s)
     # Original form is in [cm^3/s], so multiply by 1.0e-6 to convert to [m^3/s]
@@ -774,16 +783,24 @@ def bosch_hale_reactivity(
         1.0e-6
         * reaction_constants.cc1
         * theta
-        * np.sqrt(xi / (reaction_constants.mrc2 * ion_temperature_profile**3))
+        * np.sqrt(
+            xi
+            / (
+                reaction_constants.mrc2
+                * ion_temperature_profile
+                * ion_temperature_profile
+                * ion_temperature_profile
+            )
+        )
         * np.exp(-3.0 * xi)
     )
 
     # if t = 0, sigmav = 0. Use this mask to set sigmav to zero.
-    t_mask = ion_temperature_profile == 0.0
-    sigmav[t_mask] = 0.0
+    sigmav = np.where(ion_temperature_profile == 0.0, 0.0, sigmav)
 
-    # Return np.ndarray of sigmav for each point in the ion temperature profile
-    return sigmav
+    # Return sigmav for each point in the ion temperature profile, or a float for a
+    # single temperature
+    return sigmav if sigmav.ndim else float(sigmav)
 
 
 def set_fusion_powers(
@@ -1106,7 +1123,7 @@ def beamcalc(
 
     # Calculate the characterstic time for the deuterium ions to slow down to the thermal energy, eg E = 0.
     characteristic_deuterium_beam_slow_time = (
-        beam_slow_time / 3.0 * np.log(1.0 + (beam_energy_ratio_deuterium) ** 1.5)
+        beam_slow_time / 3.0 * math.log(1.0 + (beam_energy_ratio_deuterium) ** 1.5)
     )
 
     deuterium_beam_density = (
@@ -1121,7 +1138,7 @@ def beamcalc(
     # Calculate the characterstic time for the tritium to slow down to the thermal energy, eg E = 0.
     # Wesson, J. (2011) Tokamaks.
     characteristic_tritium_beam_slow_time = (
-        beam_slow_time / 3.0 * np.log(1.0 + (beam_energy_ratio_tritium) ** 1.5)
+        beam_slow_time / 3.0 * math.log(1.0 + (beam_energy_ratio_tritium) ** 1.5)
     )
 
     tritium_beam_density = (
@@ -1134,7 +1151,7 @@ def beamcalc(
 
     # Find the speed of the deuterium particle when it has the critical energy.
     # Re-arrange kinetic energy equation to find speed. Non-relativistic.
-    deuterium_critical_energy_speed = np.sqrt(
+    deuterium_critical_energy_speed = math.sqrt(
         2.0
         * constants.KILOELECTRON_VOLT
         * critical_energy_deuterium
@@ -1143,7 +1160,7 @@ def beamcalc(
 
     # Find the speed of the tritium particle when it has the critical energy.
     # Re-arrange kinetic energy equation to find speed. Non-relativistic.
-    tritium_critical_energy_speed = np.sqrt(
+    tritium_critical_energy_speed = math.sqrt(
         2.0
         * constants.KILOELECTRON_VOLT
         * critical_energy_tritium
@@ -1256,14 +1273,15 @@ def fast_ion_pressure_integral(e_beam_kev: float, critical_energy: float) -> flo
     """
 
     xcs = e_beam_kev / critical_energy
-    xc = np.sqrt(xcs)
+    xc = math.sqrt(xcs)
 
     t1 = xcs / 2.0
-    t2 = np.log((xcs + 2.0 * xc + 1.0) / (xcs - xc + 1.0)) / 6.0
+    t2 = math.log((xcs + 2.0 * xc + 1.0) / (xcs - xc + 1.0)) / 6.0
 
-    xarg = (2.0 * xc - 1.0) / np.sqrt(3.0)
-    t3 = np.arctan(xarg) / np.sqrt(3.0)
-    t4 = (1 / np.sqrt(3.0)) * np.arctan(1 / np.sqrt(3.0))
+    sqrt3 = math.sqrt(3.0)
+    xarg = (2.0 * xc - 1.0) / sqrt3
+    t3 = math.atan(xarg) / sqrt3
+    t4 = (1 / sqrt3) * math.atan(1 / sqrt3)
 
     return t1 + t2 - t3 - t4
 
@@ -1304,12 +1322,8 @@ def alpha_power_beam(
           doi: https://doi.org/10.1088/0029-5515/32/4/i07.
     """
     # Calculate the reactivity ratio
-    ratio = (
-        sigmav_dt
-        / bosch_hale_reactivity(
-            np.array([temp_plasma_ion_vol_avg_kev]),
-            BoschHaleConstants(**REACTION_CONSTANTS_DT),
-        ).item()
+    ratio = sigmav_dt / bosch_hale_reactivity(
+        temp_plasma_ion_vol_avg_kev, BOSCH_HALE_CONSTANTS_DT
     )
 
     # Calculate and return the alpha power
@@ -1352,14 +1366,16 @@ def beam_reaction_rate(
 
     # Find the speed of the beam particle when it has the critical energy.
     # Re-arrange kinetic energy equation to find speed. Non-relativistic.
-    beam_velocity = np.sqrt(
+    beam_velocity = math.sqrt(
         (beam_energy_keV * constants.KILOELECTRON_VOLT)
         * 2.0
         / (relative_mass_ion * constants.ATOMIC_MASS_UNIT)
     )
 
     relative_velocity = beam_velocity / critical_velocity
-    integral_coefficient = 3.0 * critical_velocity / np.log(1.0 + (relative_velocity**3))
+    integral_coefficient = (
+        3.0 * critical_velocity / math.log(1.0 + (relative_velocity**3))
+    )
 
     fusion_integral = integrate.quad(
         _hot_beam_fusion_reaction_rate_integrand,
@@ -1371,6 +1387,7 @@ def beam_reaction_rate(
     return integral_coefficient * fusion_integral
 
 
+@njit(cache=True)
 def _hot_beam_fusion_reaction_rate_integrand(
     velocity_ratio: float, critical_velocity: float
 ) -> float:
@@ -1397,7 +1414,8 @@ def _hot_beam_fusion_reaction_rate_integrand(
     References:
         - P J Knight, CCFE, Culham Science Centre
     """
-    intgeral_term = (velocity_ratio**3) / (1.0 + velocity_ratio**3)
+    velocity_ratio_cubed = velocity_ratio * velocity_ratio * velocity_ratio
+    intgeral_term = velocity_ratio_cubed / (1.0 + velocity_ratio_cubed)
 
     # critical_velocity : critical velocity for electron/ion slowing down of beam ion (m/s)
     beam_velcoity = critical_velocity * velocity_ratio
@@ -1411,6 +1429,7 @@ def _hot_beam_fusion_reaction_rate_integrand(
     return intgeral_term * cross_section
 
 
+@njit(cache=True)
 def _beam_fusion_cross_section(vrelsq: float) -> float:
     """
     Calculate the fusion reaction cross-section.
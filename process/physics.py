@@ -5,7 +5,6 @@ import numba as nb
 import numpy as np
 import scipy
 import scipy.integrate as integrate
-from scipy.optimize import root_scalar
 
 import process.confinement_time as confinement
 import process.fusion_reactions as reactions
@@ -6801,7 +6800,7 @@ class Physics:
         - Energy confinement times
         - Required H-factors for power balance
 
-        The routine iterates over a range of confinement times, skipping the first user input and a specific index (25). For each confinement time, it calculates various parameters related to confinement and ignition using the `calculate_confinement_time` method. It then calculates the H-factor for when the plasma is ignited using the `find_other_h_factors` method and writes the results to the output file.
+        The routine iterates over a range of confinement times, skipping the first user input and a specific index (25). For each confinement time, it calculates various parameters related to confinement and ignition using the `calculate_confinement_time` method. It then calculates the H-factor for when the plasma is ignited using the `h_factor_from_transport_loss` method and writes the results to the output file.
 
         Output format:
         - Header: "Energy confinement times, and required H-factors :"
@@ -6809,7 +6808,7 @@ class Physics:
 
         Methods used:
         - `calculate_confinement_time`: Calculates confinement-related parameters.
-        - `find_other_h_factors`: Calculates the H-factor for a given confinement time.
+        - `h_factor_from_transport_loss`: Calculates the power balance H-factor from the H = 1 transport losses.
 
         Parameters:
         - istell (int): Indicator for stellarator (0 for tokamak, >=1 for stellarator).
@@ -6843,8 +6842,8 @@ class Physics:
             if i_confinement_time == 25:
                 continue
             (
-                _,
-                _,
+                ptrez,
+                ptriz,
                 taueez,
                 _,
                 _,
@@ -6880,7 +6879,7 @@ class Physics:
             try:
                 # Calculate the H-factor for the same confinement time in other scalings
                 physics_variables.hfac[i_confinement_time - 1] = (
-                    self.find_other_h_factors(i_confinement_time)
+                    self.h_factor_from_transport_loss(ptrez + ptriz)
                 )
             except ValueError:
                 # This is only used for a table in the OUT.DAT so if it fails
@@ -7737,88 +7736,54 @@ class Physics:
             * temp_plasma_pedestal_kev**0.0552
         )
 
-    def find_other_h_factors(self, i_confinement_time: int) -> float:
+    def h_factor_from_transport_loss(self, pden_transport_loss_mw: float) -> float:
         """
         Function to find H-factor for the equivalent confinement time in other scalings.
 
+        The transport losses are inversely proportional to the H-factor, so the power
+        balance is solved in closed form from the transport losses at H = 1.
+
         Args:
-            i_confinement_time (int): Index of the confinement time scaling to use.
+            pden_transport_loss_mw (float): Electron plus ion transport loss power
+                density at H = 1 for the scaling of interest (MW/m3).
 
         Returns:
             float: The calculated H-factor.
-        """
-
-        def fhz(hfact: float) -> float:
-            """
-            Function used to find power balance.
 
-            Args:
-                hfact (float): H-factor to be used in the calculation.
+        Raises:
+            ValueError: If there is no power balance H-factor between 0.01 and 150.
+        """
+        # Heating power density that the transport losses must balance
+        pden_heating = (
+            physics_variables.f_p_alpha_plasma_deposited
+            * physics_variables.pden_alpha_total_mw
+            + physics_variables.pden_non_alpha_charged_mw
+            + physics_variables.pden_plasma_ohmic_mw
+        )
 
-            Returns:
-                float: The difference between the calculated power and the required power for balance.
-            """
-            (
-                ptrez,
-                ptriz,
-                _,
-                _,
-                _,
-                _,
-            ) = self.calculate_confinement_time(
-                physics_variables.m_fuel_amu,
-                physics_variables.p_alpha_total_mw,
-                physics_variables.aspect,
-                physics_variables.b_plasma_toroidal_on_axis,
-                physics_variables.nd_plasma_ions_total_vol_avg,
-                physics_variables.nd_plasma_electrons_vol_avg,
-                physics_variables.nd_plasma_electron_line,
-                physics_variables.eps,
-                hfact,
-                i_confinement_time,
-                physics_variables.i_plasma_ignited,
-                physics_variables.kappa,
-                physics_variables.kappa95,
-                physics_variables.p_non_alpha_charged_mw,
-                current_drive_variables.p_hcd_injected_total_mw,
-                physics_variables.plasma_current,
-                physics_variables.pden_plasma_core_rad_mw,
-                physics_variables.rmajor,
-                physics_variables.rminor,
-                physics_variables.temp_plasma_electron_density_weighted_kev,
-                physics_variables.temp_plasma_ion_density_weighted_kev,
-                physics_variables.q95,
-                physics_variables.qstar,
-                physics_variables.vol_plasma,
-                physics_variables.n_charge_plasma_effective_vol_avg,
+        # Take into account whether injected power is included in tau_e calculation (i.e. whether device is ignited)
+        if physics_variables.i_plasma_ignited == 0:
+            pden_heating += (
+                current_drive_variables.p_hcd_injected_total_mw
+                / physics_variables.vol_plasma
             )
 
-            # At power balance, fhz is zero.
-            fhz_value = (
-                ptrez
-                + ptriz
-                - physics_variables.f_p_alpha_plasma_deposited
-                * physics_variables.pden_alpha_total_mw
-                - physics_variables.pden_non_alpha_charged_mw
-                - physics_variables.pden_plasma_ohmic_mw
-            )
+        # Include the radiation power if requested
+        if physics_variables.i_rad_loss == 0:
+            pden_heating -= physics_variables.pden_plasma_rad_mw
+        elif physics_variables.i_rad_loss == 1:
+            pden_heating -= physics_variables.pden_plasma_core_rad_mw
 
-            # Take into account whether injected power is included in tau_e calculation (i.e. whether device is ignited)
-            if physics_variables.i_plasma_ignited == 0:
-                fhz_value -= (
-                    current_drive_variables.p_hcd_injected_total_mw
-                    / physics_variables.vol_plasma
-                )
+        # At power balance pden_transport_loss_mw / hfact = pden_heating
+        if pden_heating <= 0.0:
+            raise ValueError(f"No power balance H-factor: {pden_heating=}")
 
-            # Include the radiation power if requested
-            if physics_variables.i_rad_loss == 0:
-                fhz_value += physics_variables.pden_plasma_rad_mw
-            elif physics_variables.i_rad_loss == 1:
-                fhz_value += physics_variables.pden_plasma_core_rad_mw
+        hfact = pden_transport_loss_mw / pden_heating
 
-            return fhz_value
+        if not 0.01 <= hfact <= 150.0:
+            raise ValueError(f"Power balance H-factor out of range: {hfact=}")
 
-        return root_scalar(fhz, bracket=(0.01, 150), xtol=0.001).root
+        return hfact
 
     @staticmethod
     def calculate_confinement_time(
@@ -11,7 +11,7 @@ from process.plasma_profiles import PlasmaProfile
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RadpwrData:
     """DataClass which holds the output of the function radpwr"""
 
@@ -5,9 +5,11 @@ from typing import Any, NamedTuple
 import numpy as np
 import pytest
 from pytest import approx
+from scipy import integrate
 
 from process import fusion_reactions as reactions
 from process.data_structure import physics_variables as pv
+from process.plasma_profiles import PlasmaProfile
 
 
 class SetFusionPowersParam(NamedTuple):
@@ -249,6 +251,84 @@ def test_bosch_hale(t, reaction, expected_bosch_hale):
     assert bosch_hale == approx(expected_bosch_hale, abs=1e-23)
 
 
+@pytest.mark.parametrize(
+    "reaction_constants",
+    (
+        reactions.BOSCH_HALE_CONSTANTS_DT,
+        reactions.BOSCH_HALE_CONSTANTS_DHE3,
+        reactions.BOSCH_HALE_CONSTANTS_DD1,
+        reactions.BOSCH_HALE_CONSTANTS_DD2,
+    ),
+    ids=["DT", "DHE3", "DD1", "DD2"],
+)
+def test_bosch_hale_scalar(reaction_constants):
+    """
+    Unit test for the bosch_hale function with a single temperature.
+
+    :param reaction_constants: Bosch-Hale constants for the reaction
+    :type reaction_constants: BoschHaleConstants
+    """
+    bosch_hale = reactions.bosch_hale_reactivity(55.73, reaction_constants)
+
+    assert isinstance(bosch_hale, float)
+    assert bosch_hale == approx(
+        reactions.bosch_hale_reactivity(np.array([55.73]), reaction_constants).item(),
+        rel=1e-14,
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        assert reactions.bosch_hale_reactivity(0.0, reaction_constants) == 0.0
+
+
+@pytest.mark.parametrize(
+    "reaction_constants, expected_integral",
+    (
+        (reactions.BOSCH_HALE_CONSTANTS_DT, 2.280733081058562e-22),
+        (reactions.BOSCH_HALE_CONSTANTS_DHE3, 1.5967864956465222e-24),
+        (reactions.BOSCH_HALE_CONSTANTS_DD1, 1.3392109489605335e-24),
+        (reactions.BOSCH_HALE_CONSTANTS_DD2, 1.241857813215675e-24),
+    ),
+    ids=["DT", "DHE3", "DD1", "DD2"],
+)
+def test_fusion_rate_integral(reaction_constants, expected_integral, monkeypatch):
+    """
+    Unit test for the fusion_rate_integral function.
+
+    The reactivity profile is evaluated by the caller and passed in. The expected
+    values were produced when fusion_rate_integral() evaluated the Bosch-Hale
+    reactivity itself from the reaction constants.
+
+    :param reaction_constants: Bosch-Hale constants for the reaction
+    :type reaction_constants: BoschHaleConstants
+    :param expected_integral: expected Simpson integral of the integrand
+    :type expected_integral: float
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+    """
+    monkeypatch.setattr(pv, "temp_plasma_ion_vol_avg_kev", 12.0)
+    monkeypatch.setattr(pv, "temp_plasma_electron_vol_avg_kev", 13.0)
+    monkeypatch.setattr(pv, "nd_plasma_electrons_vol_avg", 8.0e19)
+
+    rho = np.linspace(0.0, 1.0, 11)
+    plasma_profile = PlasmaProfile()
+    plasma_profile.teprofile.profile_x = rho
+    plasma_profile.teprofile.profile_y = 25.0 * (1.0 - rho**2)
+    plasma_profile.neprofile.profile_x = rho
+    plasma_profile.neprofile.profile_y = 1.0e20 * (1.0 - rho**2) ** 0.5
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigv = reactions.bosch_hale_reactivity(
+            (12.0 / 13.0) * plasma_profile.teprofile.profile_y, reaction_constants
+        )
+    integrand = reactions.fusion_rate_integral(plasma_profile, sigv)
+
+    # Zero temperature at the separatrix gives zero reactivity
+    assert integrand[-1] == 0.0
+    assert integrate.simpson(integrand, x=rho, dx=0.1) == approx(
+        expected_integral, rel=1e-12
+    )
+
+
 def test_beam_fusion():
     beta_beam, nd_beam_ions_out, p_beam_alpha_mw = reactions.beam_fusion(
         1.0,
@@ -0,0 +1,247 @@
+"""Unit tests for the equivalent H-factors in physics.py."""
+
+import io
+
+import numpy as np
+import pytest
+from scipy.optimize import root_scalar
+
+from process import process_output as po
+from process.current_drive import (
+    CurrentDrive,
+    ElectronBernstein,
+    ElectronCyclotron,
+    IonCyclotron,
+    LowerHybrid,
+    NeutralBeam,
+)
+from process.data_structure import current_drive_variables, physics_variables
+from process.physics import Physics
+from process.plasma_profiles import PlasmaProfile
+
+# Plasma state taken from tests/regression/scenarios/large-tokamak/IN.DAT
+VOL_PLASMA = 1888.1711539956691
+P_ALPHA_TOTAL_MW = 319.03020327154269
+P_NON_ALPHA_CHARGED_MW = 1.2453296074483358
+P_PLASMA_OHMIC_MW = 0.63634001890069991
+P_HCD_INJECTED_TOTAL_MW = 75.397788712812741
+
+
+@pytest.fixture
+def physics():
+    """Provides Physics object for testing.
+
+    :returns: initialised Physics object
+    :rtype: process.physics.Physics
+    """
+    return Physics(
+        PlasmaProfile(),
+        CurrentDrive(
+            PlasmaProfile(),
+            electron_cyclotron=ElectronCyclotron(plasma_profile=PlasmaProfile()),
+            ion_cyclotron=IonCyclotron(plasma_profile=PlasmaProfile()),
+            neutral_beam=NeutralBeam(plasma_profile=PlasmaProfile()),
+            electron_bernstein=ElectronBernstein(plasma_profile=PlasmaProfile()),
+            lower_hybrid=LowerHybrid(plasma_profile=PlasmaProfile()),
+        ),
+    )
+
+
+@pytest.fixture
+def output_files(monkeypatch):
+    """Redirect OUT.DAT and MFILE.DAT writes to in-memory buffers."""
+    monkeypatch.setattr(po.OutputFileManager, "_outfile", io.StringIO(), raising=False)
+    monkeypatch.setattr(po.OutputFileManager, "_mfile", io.StringIO(), raising=False)
+
+
+def set_plasma_state(monkeypatch, i_rad_loss: int, i_plasma_ignited: int):
+    """Set the physics_variables used by the confinement comparison.
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+    :param i_rad_loss: switch for radiation loss term in the power balance
+    :type i_rad_loss: int
+    :param i_plasma_ignited: switch for ignited calculation
+    :type i_plasma_ignited: int
+    """
+    for name, value in {
+        "i_rad_loss": i_rad_loss,
+        "i_plasma_ignited": i_plasma_ignited,
+        "tauee_in": 0.0,
+        "pden_plasma_rad_mw": 0.11824275660100725,
+        "pden_plasma_core_rad_mw": 0.047757569353246924,
+        "p_plasma_ohmic_mw": P_PLASMA_OHMIC_MW,
+        "pden_plasma_ohmic_mw": P_PLASMA_OHMIC_MW / VOL_PLASMA,
+        "f_p_alpha_plasma_deposited": 0.94999999999999996,
+        "p_alpha_total_mw": P_ALPHA_TOTAL_MW,
+        "pden_alpha_total_mw": P_ALPHA_TOTAL_MW / VOL_PLASMA,
+        "p_non_alpha_charged_mw": P_NON_ALPHA_CHARGED_MW,
+        "pden_non_alpha_charged_mw": P_NON_ALPHA_CHARGED_MW / VOL_PLASMA,
+        "m_fuel_amu": 2.5,
+        "m_ions_total_amu": 2.5,
+        "triang": 0.5,
+        "aspect": 3.0,
+        "b_plasma_toroidal_on_axis": 5.2375830857646202,
+        "nd_plasma_electrons_vol_avg": 8.0593948787884524e19,
+        "nd_plasma_ions_total_vol_avg": 7.1529510234203251e19,
+        "nd_plasma_electron_line": 8.925359201116491e19,
+        "eps": 0.33333333333333331,
+        "kappa": 1.8500000000000001,
+        "kappa95": 1.6517857142857142,
+        "plasma_current": 16616203.759182997,
+        "q95": 3.5610139569387185,
+        "qstar": 2.9513713188821282,
+        "rmajor": 8.0,
+        "rminor": 2.6666666666666665,
+        "temp_plasma_electron_density_weighted_kev": 13.745148298980761,
+        "temp_plasma_ion_density_weighted_kev": 13.745148298980761,
+        "vol_plasma": VOL_PLASMA,
+        "n_charge_plasma_effective_vol_avg": 2.4987360098030775,
+    }.items():
+        monkeypatch.setattr(physics_variables, name, value)
+
+    monkeypatch.setattr(
+        current_drive_variables, "p_hcd_injected_total_mw", P_HCD_INJECTED_TOTAL_MW
+    )
+
+
+def root_scalar_h_factor(physics, i_confinement_time: int) -> float:
+    """Solve the power balance residual for H with a bracketed root search.
+
+    This is the method originally used to find the equivalent H-factors, run
+    here with a tight tolerance as a reference for the closed form.
+
+    :param physics: Physics object
+    :type physics: process.physics.Physics
+    :param i_confinement_time: index of the confinement time scaling to use
+    :type i_confinement_time: int
+    :returns: H-factor at power balance
+    :rtype: float
+    """
+
+    def fhz(hfact: float) -> float:
+        ptrez, ptriz, *_ = physics.calculate_confinement_time(
+            physics_variables.m_fuel_amu,
+            physics_variables.p_alpha_total_mw,
+            physics_variables.aspect,
+            physics_variables.b_plasma_toroidal_on_axis,
+            physics_variables.nd_plasma_ions_total_vol_avg,
+            physics_variables.nd_plasma_electrons_vol_avg,
+            physics_variables.nd_plasma_electron_line,
+            physics_variables.eps,
+            hfact,
+            i_confinement_time,
+            physics_variables.i_plasma_ignited,
+            physics_variables.kappa,
+            physics_variables.kappa95,
+            physics_variables.p_non_alpha_charged_mw,
+            current_drive_variables.p_hcd_injected_total_mw,
+            physics_variables.plasma_current,
+            physics_variables.pden_plasma_core_rad_mw,
+            physics_variables.rmajor,
+            physics_variables.rminor,
+            physics_variables.temp_plasma_electron_density_weighted_kev,
+            physics_variables.temp_plasma_ion_density_weighted_kev,
+            physics_variables.q95,
+            physics_variables.qstar,
+            physics_variables.vol_plasma,
+            physics_variables.n_charge_plasma_effective_vol_avg,
+        )
+
+        fhz_value = (
+            ptrez
+            + ptriz
+            - physics_variables.f_p_alpha_plasma_deposited
+            * physics_variables.pden_alpha_total_mw
+            - physics_variables.pden_non_alpha_charged_mw
+            - physics_variables.pden_plasma_ohmic_mw
+        )
+
+        if physics_variables.i_plasma_ignited == 0:
+            fhz_value -= (
+                current_drive_variables.p_hcd_injected_total_mw
+                / physics_variables.vol_plasma
+            )
+
+        if physics_variables.i_rad_loss == 0:
+            fhz_value += physics_variables.pden_plasma_rad_mw
+        elif physics_variables.i_rad_loss == 1:
+            fhz_value += physics_variables.pden_plasma_core_rad_mw
+
+        return fhz_value
+
+    return root_scalar(fhz, bracket=(0.01, 150), xtol=1e-12, rtol=1e-14).root
+
+
+@pytest.mark.parametrize("i_plasma_ignited", [0, 1])
+@pytest.mark.parametrize("i_rad_loss", [0, 1, 2])
+def test_h_factors_match_root_solve(
+    i_rad_loss, i_plasma_ignited, monkeypatch, physics, output_files
+):
+    """Check the closed-form H-factors against a root solve of the power balance.
+
+    The H = 1 transport losses are those computed by
+    output_confinement_comparison() for each scaling in the OUT.DAT table.
+
+    :param i_rad_loss: switch for radiation loss term in the power balance
+    :type i_rad_loss: int
+    :param i_plasma_ignited: switch for ignited calculation
+    :type i_plasma_ignited: int
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+    """
+    set_plasma_state(monkeypatch, i_rad_loss, i_plasma_ignited)
+
+    physics.output_confinement_comparison(istell=0)
+
+    n_compared = 0
+    for i_confinement_time in range(1, physics_variables.N_CONFINEMENT_SCALINGS):
+        if i_confinement_time == 25:
+            continue
+
+        hfac = physics_variables.hfac[i_confinement_time - 1]
+        try:
+            expected_hfac = root_scalar_h_factor(physics, i_confinement_time)
+        except ValueError:
+            # No sign change of the residual in [0.01, 150]
+            assert np.isnan(hfac)
+            continue
+
+        assert hfac == pytest.approx(expected_hfac, rel=1e-10)
+        n_compared += 1
+
+    assert n_compared > 0
+
+
+def test_h_factor_no_heating_raises(monkeypatch, physics):
+    """Non-positive net heating has no power balance H-factor.
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+    """
+    set_plasma_state(monkeypatch, i_rad_loss=0, i_plasma_ignited=1)
+    monkeypatch.setattr(physics_variables, "pden_plasma_rad_mw", 1.0)
+
+    with pytest.raises(ValueError, match="No power balance H-factor"):
+        physics.h_factor_from_transport_loss(0.05)
+
+
+@pytest.mark.parametrize("scale", [1.0e-3, 200.0])
+def test_h_factor_out_of_range_raises(scale, monkeypatch, physics):
+    """H-factors outside [0.01, 150] are rejected.
+
+    :param scale: H-factor that the transport losses are constructed to give
+    :type scale: float
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+    """
+    set_plasma_state(monkeypatch, i_rad_loss=2, i_plasma_ignited=1)
+    pden_heating = (
+        physics_variables.f_p_alpha_plasma_deposited
+        * physics_variables.pden_alpha_total_mw
+        + physics_variables.pden_non_alpha_charged_mw
+        + physics_variables.pden_plasma_ohmic_mw
+    )
+
+    with pytest.raises(ValueError, match="out of range"):
+        physics.h_factor_from_transport_loss(scale * pden_heating)